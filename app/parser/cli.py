@@ -0,0 +1,112 @@
+"""Pipeline entry point.
+
+Each subcommand imports only the module it runs, so cheap steps like
+`dedup` or `export` never load requests, bs4 or Selenium.
+
+    python app/parser/cli.py dedup
+    python app/parser/cli.py export --output companies.csv
+"""
+
+import argparse
+import json
+
+DATA_FILE = "app/parser/data/yc_s25_companies.json"
+DEDUP_FILE = "app/parser/data/yc_s25_companies_deduplicated.json"
+
+EXPORT_FIELDS = [
+    "name",
+    "description",
+    "website",
+    "yc_profile_url",
+    "linkedin_url",
+    "linkedin_mentions_s25",
+    "source",
+]
+
+
+def scrape_yc(args):
+    from yc_parser import scrape_and_save
+
+    scrape_and_save(args.output)
+
+
+def enrich(args):
+    if args.shards > 1:
+        from sharding import enrich_all_sharded
+
+        enrich_all_sharded(args.shards, args.input)
+    else:
+        from linkedin_parser import enrich_all_from_json
+
+        enrich_all_from_json(args.input)
+
+
+def discover(args):
+    from linkedin_enricher import (
+        add_new_linkedin_companies,
+        extract_similar_linkedin_companies,
+    )
+
+    links = extract_similar_linkedin_companies(args.input)
+    add_new_linkedin_companies(links, args.input, args.output)
+
+
+def dedup(args):
+    from linkedin_enricher import (
+        deduplicate_and_merge,
+        load_existing_companies,
+        save_companies,
+    )
+
+    companies = load_existing_companies(args.input)
+    save_companies(deduplicate_and_merge(companies), args.output)
+
+
+def export(args):
+    import csv
+
+    with open(args.input, "r", encoding="utf-8") as f:
+        companies = json.load(f)
+
+    with open(args.output, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, EXPORT_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(companies)
+
+    print(f"Exported {len(companies)} companies to {args.output}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="YC S25 pipeline")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("scrape-yc", help="scrape the YC directory (Selenium)")
+    p.add_argument("--output", default=DATA_FILE)
+    p.set_defaults(func=scrape_yc)
+
+    p = sub.add_parser("enrich", help="check LinkedIn pages for S25 mentions")
+    p.add_argument("--input", default=DATA_FILE)
+    p.add_argument("--shards", type=int, default=1)
+    p.set_defaults(func=enrich)
+
+    p = sub.add_parser("discover", help="add similar companies from LinkedIn")
+    p.add_argument("--input", default=DATA_FILE)
+    p.add_argument("--output", default=DEDUP_FILE)
+    p.set_defaults(func=discover)
+
+    p = sub.add_parser("dedup", help="merge duplicate companies")
+    p.add_argument("--input", default=DATA_FILE)
+    p.add_argument("--output", default=DEDUP_FILE)
+    p.set_defaults(func=dedup)
+
+    p = sub.add_parser("export", help="write companies to CSV")
+    p.add_argument("--input", default=DEDUP_FILE)
+    p.add_argument("--output", default="yc_s25_companies.csv")
+    p.set_defaults(func=export)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -16,5 +16,32 @@ LINKEDIN_SELECTORS = {
 
 HEADERS = {"User-Agent": "Mozilla/5.0", "Accept-Language": "en-US,en;q=0.9"}
 
+HEADER_PROFILES = [
+    HEADERS,
+    {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0 Safari/537.36",
+        "Accept-Language": "en-US,en;q=0.9",
+    },
+    {
+        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 14_4) AppleWebKit/605.1.15 "
+        "(KHTML, like Gecko) Version/17.4 Safari/605.1.15",
+        "Accept-Language": "en-GB,en;q=0.8",
+    },
+]
+
+POLITENESS = {
+    "min_delay": 1.0,  # seconds between batches
+    "max_delay": 60.0,
+    "delay_step": 0.25,  # additive decrease on success
+    "max_concurrency": 4,
+    "concurrency_step": 0.25,  # additive increase on success
+    "backoff_factor": 2.0,  # multiplicative change on block
+    "block_window": 20,  # recent responses used for block rate
+    "block_threshold": 0.5,
+    "pause_seconds": 300,
+    "max_pauses": 2,
+}
+
 YC_TAGS = ["yc", "ycombinator", "y combinator"]
 S25_TAGS = ["s25", "summer 2025", "summer2025", "2025summer", "2025 summer"]
@@ -1,5 +1,3 @@
-import requests
-from bs4 import BeautifulSoup
 import time
 import os
 import json
@@ -12,6 +10,9 @@ DATA_FILE = "data/yc_s25_companies.json"
 
 def extract_and_check(linkedin_url):
     """Scrape LinkedIn and format new company entry if it's not in existing data."""
+    import requests
+    from bs4 import BeautifulSoup
+
     time.sleep(1)  # For rate limits
 
     matched, match_info = linkedin_check_yc_mention(linkedin_url)
@@ -66,7 +67,10 @@ def load_existing_companies(path=DATA_FILE):
     return []
 
 
-def save_companies(companies, path="data/yc_s25_companies_deduplicated.json"):
+DEDUP_FILE = "data/yc_s25_companies_deduplicated.json"
+
+
+def save_companies(companies, path=DEDUP_FILE):
     with open(path, "w", encoding="utf-8") as f:
         json.dump(companies, f, indent=2, ensure_ascii=False)
 
@@ -78,8 +82,10 @@ def normalize_linkedin_url(url):
     return parts[1] if len(parts) > 1 else url.rstrip("/")
 
 
-def add_new_linkedin_companies(linkedin_urls):
-    companies = load_existing_companies()
+def add_new_linkedin_companies(
+    linkedin_urls, input_path=DATA_FILE, output_path=DEDUP_FILE
+):
+    companies = load_existing_companies(input_path)
 
     new_entries = []
 
@@ -103,16 +109,19 @@ def add_new_linkedin_companies(linkedin_urls):
             new_entries.append(data)
             existing_links.add(url)
 
-    save_companies(companies)
+    save_companies(companies, output_path)
 
     print(f"Added {len(new_entries)} new companies.")
 
 
-def extract_similar_linkedin_companies():
+def extract_similar_linkedin_companies(path=DATA_FILE):
     """Extract similar companies listed on a LinkedIn company page."""
+    import requests
+    from bs4 import BeautifulSoup
+
     links = []
     try:
-        companies = load_existing_companies()
+        companies = load_existing_companies(path)
         existing_links = {c["linkedin_url"] for c in companies if c.get("linkedin_url")}
 
         for linkedin_url in existing_links:
@@ -1,14 +1,23 @@
-import requests
-from bs4 import BeautifulSoup
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 from config import LINKEDIN_SELECTORS, HEADERS, YC_TAGS, S25_TAGS
 
 
-def linkedin_check_yc_mention(linkedin_url):
+def linkedin_check_yc_mention(linkedin_url, controller=None):
+    import requests
+    from bs4 import BeautifulSoup
+
     try:
-        resp = requests.get(linkedin_url, headers=HEADERS, timeout=10)
+        headers = controller.headers if controller else HEADERS
+        resp = requests.get(linkedin_url, headers=headers, timeout=10)
+
+        if controller:
+            outcome = controller.record_response(resp)
+            if outcome != "ok":
+                print(f"{linkedin_url} → {outcome} (HTTP {resp.status_code})")
+                return None, None
 
         if resp.status_code != 200:
             print(f"{linkedin_url} → HTTP {resp.status_code}")
@@ -49,7 +58,9 @@ def linkedin_check_yc_mention(linkedin_url):
         return None, None
 
 
-def enrich_all_from_json(input_path="data/yc_s25_companies.json"):
+def enrich_all_from_json(input_path="data/yc_s25_companies.json", controller=None):
+    from politeness import BlockedError, PolitenessController
+
     if not os.path.exists(input_path):
         print(f"File not found: {input_path}")
         return
@@ -57,26 +68,50 @@ def enrich_all_from_json(input_path="data/yc_s25_companies.json"):
     with open(input_path, "r", encoding="utf-8") as f:
         companies = json.load(f)
 
-    updated = 0
-    for company in companies:
-        if not company.get("linkedin_url"):
-            continue
-        if company.get("linkedin_mentions_s25") is not None:
-            continue  # Already enriched
-
-        print(f"🔎 Checking {company['name']}...")
+    def save():
+        with open(input_path, "w", encoding="utf-8") as f:
+            json.dump(companies, f, indent=2, ensure_ascii=False)
 
-        matched, match_info = linkedin_check_yc_mention(company["linkedin_url"])
-        if matched is not None:
-            company["linkedin_mentions_s25"] = matched
-            company["linkedin_match"] = match_info
-            updated += 1
-            print(f"Result: {matched} @ {match_info}")
-        else:
-            print(f"Could not determine for {company['name']}")
+    controller = controller or PolitenessController()
+    pending = [
+        c
+        for c in companies
+        if c.get("linkedin_url") and c.get("linkedin_mentions_s25") is None
+    ]
 
-    with open(input_path, "w", encoding="utf-8") as f:
-        json.dump(companies, f, indent=2, ensure_ascii=False)
+    updated = 0
+    with ThreadPoolExecutor(max_workers=controller.settings["max_concurrency"]) as pool:
+        while pending:
+            batch = pending[: controller.batch_size]
+            pending = pending[len(batch) :]
+
+            for company in batch:
+                print(f"🔎 Checking {company['name']}...")
+            results = pool.map(
+                lambda c: linkedin_check_yc_mention(c["linkedin_url"], controller),
+                batch,
+            )
+
+            for company, (matched, match_info) in zip(batch, results):
+                if matched is not None:
+                    company["linkedin_mentions_s25"] = matched
+                    company["linkedin_match"] = match_info
+                    updated += 1
+                    print(f"Result: {matched} @ {match_info}")
+                else:
+                    print(f"Could not determine for {company['name']}")
+
+            if not pending:
+                break
+            if controller.should_pause():
+                save()  # checkpoint before cooling down or giving up
+            try:
+                controller.wait()
+            except BlockedError as e:
+                print(f"[!] Stopping, LinkedIn keeps blocking us: {e}")
+                break
+
+    save()
 
     print(f"Done. Updated {updated} companies.")
 
@@ -86,6 +121,9 @@ DATA_FILE = "app/parser/data/yc_s25_companies.json"
 
 def extract_and_check(linkedin_url):
     """Scrape LinkedIn and format new company entry if it's not in existing data."""
+    import requests
+    from bs4 import BeautifulSoup
+
     matched, match_info = linkedin_check_yc_mention(linkedin_url)
 
     if matched is None:
@@ -0,0 +1,145 @@
+import threading
+import time
+from collections import deque
+
+from config import HEADER_PROFILES, POLITENESS
+
+OK = "ok"
+BLOCKED = "blocked"
+THROTTLED = "throttled"
+ERROR = "error"
+
+
+class BlockedError(Exception):
+    """Raised when the block rate stays above the threshold after all pauses."""
+
+
+def classify_response(resp):
+    """Tell apart normal pages, LinkedIn blocks (999, authwall) and throttling."""
+    if resp.status_code == 429:
+        return THROTTLED
+    if resp.status_code == 999:
+        return BLOCKED
+    urls = [str(r.headers.get("Location", "")) for r in resp.history]
+    urls.append(str(resp.url))
+    if any("authwall" in u or "/login" in u for u in urls):
+        return BLOCKED
+    if resp.status_code != 200:
+        return ERROR
+    return OK
+
+
+class PolitenessController:
+    """AIMD controller for request delay and concurrency.
+
+    Every successful response nudges concurrency up and the delay down by a
+    fixed step; every block or throttle cuts concurrency and multiplies the
+    delay by `backoff_factor`, and switches to the next header profile.
+    """
+
+    def __init__(self, profiles=None, sleep=time.sleep, **settings):
+        self.profiles = profiles or HEADER_PROFILES
+        self.settings = {**POLITENESS, **settings}
+        self.sleep = sleep
+
+        self.delay = self.settings["min_delay"]
+        self.concurrency = 1.0
+        self.profile_index = 0
+        self.pauses = 0
+        self.recent = deque(maxlen=self.settings["block_window"])
+        self.lock = threading.Lock()
+
+    @property
+    def headers(self):
+        return self.profiles[self.profile_index]
+
+    @property
+    def batch_size(self):
+        return max(1, int(self.concurrency))
+
+    @property
+    def block_rate(self):
+        if not self.recent:
+            return 0.0
+        return sum(self.recent) / len(self.recent)
+
+    def record(self, outcome, retry_after=None):
+        if outcome == ERROR:
+            return
+
+        blocked = outcome in (BLOCKED, THROTTLED)
+        with self.lock:
+            self._adjust(blocked, retry_after)
+
+    def _adjust(self, blocked, retry_after):
+        s = self.settings
+        self.recent.append(blocked)
+
+        if blocked:
+            self.concurrency = max(1.0, self.concurrency / s["backoff_factor"])
+            self.delay = min(s["max_delay"], self.delay * s["backoff_factor"])
+            if retry_after:
+                self.delay = min(s["max_delay"], max(self.delay, retry_after))
+            self.profile_index = (self.profile_index + 1) % len(self.profiles)
+        else:
+            self.concurrency = min(
+                s["max_concurrency"], self.concurrency + s["concurrency_step"]
+            )
+            self.delay = max(s["min_delay"], self.delay - s["delay_step"])
+
+    def record_response(self, resp):
+        outcome = classify_response(resp)
+        retry_after = resp.headers.get("Retry-After")
+        self.record(
+            outcome,
+            float(retry_after) if retry_after and retry_after.isdigit() else None,
+        )
+        return outcome
+
+    def should_pause(self):
+        window = self.recent.maxlen
+        return (
+            len(self.recent) >= window // 2
+            and self.block_rate >= self.settings["block_threshold"]
+        )
+
+    def next_sleep(self):
+        """Seconds to sleep before the next batch, pausing if we are blocked.
+
+        Raises `BlockedError` once `max_pauses` cool-downs did not help, so
+        the caller can checkpoint and stop instead of wasting the run.
+        """
+        if self.should_pause():
+            if self.pauses >= self.settings["max_pauses"]:
+                raise BlockedError(
+                    f"Block rate {self.block_rate:.0%} after {self.pauses} pauses"
+                )
+            self.pauses += 1
+            print(
+                f"Block rate {self.block_rate:.0%}, "
+                f"pausing for {self.settings['pause_seconds']}s"
+            )
+            self.recent.clear()
+            return self.settings["pause_seconds"]
+
+        return self.delay
+
+    def wait(self):
+        self.sleep(self.next_sleep())
+
+    def state(self):
+        return {
+            "delay": self.delay,
+            "concurrency": self.concurrency,
+            "profile_index": self.profile_index,
+            "pauses": self.pauses,
+            "recent": list(self.recent),
+        }
+
+    def load_state(self, state):
+        self.delay = state["delay"]
+        self.concurrency = state["concurrency"]
+        self.profile_index = state["profile_index"] % len(self.profiles)
+        self.pauses = state["pauses"]
+        self.recent.clear()
+        self.recent.extend(state["recent"])
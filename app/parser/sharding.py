@@ -0,0 +1,462 @@
+import argparse
+import bisect
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+DATA_FILE = "app/parser/data/yc_s25_companies.json"
+QUEUE_FILE = "app/parser/data/shards.db"
+YC_QUEUE_FILE = "app/parser/data/yc_shards.db"
+
+RING_REPLICAS = 100
+
+
+def _hash(key):
+    return int(hashlib.md5(key.encode("utf-8")).hexdigest(), 16)
+
+
+def normalize_url(url):
+    return url.strip().rstrip("/").lower()
+
+
+def build_ring(num_shards, replicas=RING_REPLICAS):
+    """Build a consistent hash ring as parallel lists of points and owners.
+
+    Each shard owns `replicas` virtual points, so changing the number of
+    shards only moves the URLs next to the added or removed points.
+    """
+    if num_shards < 1:
+        raise ValueError("num_shards must be at least 1")
+    ring = sorted(
+        (_hash(f"shard-{shard}-{i}"), shard)
+        for shard in range(num_shards)
+        for i in range(replicas)
+    )
+    return [point for point, _ in ring], [shard for _, shard in ring]
+
+
+def shard_for_url(url, ring):
+    points, owners = ring
+    idx = bisect.bisect(points, _hash(normalize_url(url))) % len(points)
+    return owners[idx]
+
+
+def split_into_shards(urls, num_shards):
+    ring = build_ring(num_shards)
+    shards = [[] for _ in range(num_shards)]
+    for url in urls:
+        shards[shard_for_url(url, ring)].append(url)
+    return shards
+
+
+def connect(db_path=QUEUE_FILE, local=False):
+    """Open the queue.
+
+    WAL relies on shared memory, which does not work on network filesystems,
+    so it is only enabled for `local` runs where every worker is on this host.
+    """
+    conn = sqlite3.connect(db_path, timeout=30)
+    conn.execute(f"PRAGMA journal_mode={'WAL' if local else 'DELETE'}")
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS tasks (
+            key TEXT PRIMARY KEY,
+            url TEXT NOT NULL,
+            shard INTEGER NOT NULL,
+            status TEXT NOT NULL DEFAULT 'pending',
+            result TEXT
+        )
+        """
+    )
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS pacing (id INTEGER PRIMARY KEY, state TEXT)"
+    )
+    return conn
+
+
+def enqueue(
+    urls, num_shards, db_path=QUEUE_FILE, local=False, fresh=False, prune=False
+):
+    """Assign URLs to shards and store them in the queue.
+
+    URLs are keyed by `normalize_url`, so trailing-slash variants are fetched
+    once. URLs with a known result are kept, so re-running the coordinator
+    resumes an interrupted crawl instead of starting over. Unknown results
+    are retried.
+
+    `fresh` drops every stored result so all URLs are fetched again. `prune`
+    drops rows for URLs not passed in this time, so the merged output is a
+    snapshot of exactly these URLs.
+    """
+    urls = list({normalize_url(url): url for url in urls}.values())
+    shards = split_into_shards(urls, num_shards)
+    conn = connect(db_path, local)
+    with conn:
+        conn.execute("DELETE FROM pacing")  # a new run starts unthrottled
+        if fresh:
+            conn.execute("DELETE FROM tasks")
+        elif prune:
+            conn.execute("CREATE TEMP TABLE current_keys (key TEXT PRIMARY KEY)")
+            conn.executemany(
+                "INSERT INTO current_keys (key) VALUES (?)",
+                [(normalize_url(url),) for url in urls],
+            )
+            conn.execute(
+                "DELETE FROM tasks WHERE key NOT IN (SELECT key FROM current_keys)"
+            )
+        for shard, shard_urls in enumerate(shards):
+            conn.executemany(
+                """
+                INSERT INTO tasks (key, url, shard) VALUES (?, ?, ?)
+                ON CONFLICT(key) DO UPDATE
+                SET url = excluded.url, shard = excluded.shard,
+                    status = 'pending', result = NULL
+                WHERE status != 'done'
+                """,
+                [(normalize_url(url), url, shard) for url in shard_urls],
+            )
+    conn.close()
+    return [len(s) for s in shards]
+
+
+def is_known(result):
+    """Tell whether a task result is final or should be retried next run."""
+    if result is None:
+        return False
+    return not (isinstance(result, (list, tuple)) and result and result[0] is None)
+
+
+class SharedPacing:
+    """Politeness state shared by every shard through the queue file.
+
+    Wraps a `PolitenessController` whose AIMD state is loaded from and saved
+    to the `pacing` table around every request, so all shards back off
+    together. Requests are spread over the shards by a shared `next_at`
+    slot, and once one shard gives up the others stop too.
+
+    `next_at` is a wall-clock timestamp, so hosts sharing a queue file need
+    synchronized clocks (NTP); skew shifts the spacing by the same amount.
+    """
+
+    def __init__(self, db_path=QUEUE_FILE, local=False, sleep=time.sleep, **settings):
+        from politeness import PolitenessController
+
+        self.controller = PolitenessController(sleep=sleep, **settings)
+        self.sleep = sleep
+        self.queue = (db_path, local)
+        self.conn = connect(db_path, local)
+
+    @property
+    def headers(self):
+        return self.controller.headers
+
+    def _load(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+        row = self.conn.execute("SELECT state FROM pacing WHERE id = 1").fetchone()
+        state = json.loads(row[0]) if row else {}
+        if "delay" in state:
+            self.controller.load_state(state)
+        return state
+
+    def _save(self, state):
+        state.update(self.controller.state())
+        self.conn.execute(
+            "INSERT OR REPLACE INTO pacing (id, state) VALUES (1, ?)",
+            (json.dumps(state),),
+        )
+
+    def wait(self):
+        from politeness import BlockedError
+
+        now = time.time()
+        error = None
+        with self.conn:
+            state = self._load()
+            if state.get("stopped"):
+                raise BlockedError("Another shard was blocked")
+
+            pauses = self.controller.pauses
+            try:
+                seconds = self.controller.next_sleep()
+            except BlockedError as e:
+                state["stopped"] = True
+                error = e
+            else:
+                if self.controller.pauses > pauses:
+                    start = now + seconds
+                    state["next_at"] = start
+                else:
+                    start = max(now, state.get("next_at", now))
+                    step = self.controller.delay / self.controller.batch_size
+                    state["next_at"] = start + step
+            self._save(state)
+
+        if error:
+            raise error
+        self.sleep(max(0.0, start - now))
+
+    def record(self, outcome, retry_after=None):
+        with self.conn:
+            state = self._load()
+            self.controller.record(outcome, retry_after)
+            self._save(state)
+
+    def record_response(self, resp):
+        with self.conn:
+            state = self._load()
+            outcome = self.controller.record_response(resp)
+            self._save(state)
+        return outcome
+
+
+_queue = (QUEUE_FILE, False)
+_pacing = None
+
+
+def check_linkedin(url):
+    """Default shard task, paced together with the other shards."""
+    global _pacing
+    from linkedin_parser import linkedin_check_yc_mention
+
+    if _pacing is None or _pacing.queue != _queue:
+        _pacing = SharedPacing(*_queue)
+    _pacing.wait()
+
+    return linkedin_check_yc_mention(url, _pacing)
+
+
+_driver = None
+
+
+def parse_yc_page(url):
+    """Shard task for YC company pages; reuses one Chrome for the whole shard."""
+    global _driver
+    from yc_parser import make_driver, parse_company_page
+
+    if _driver is None:
+        _driver = make_driver()
+
+    return parse_company_page(url, driver=_driver)
+
+
+def close_driver():
+    # Pool workers exit via os._exit, so atexit would never quit Chrome.
+    global _driver
+    if _driver is not None:
+        _driver.quit()
+        _driver = None
+
+
+def run_shard(shard, db_path=QUEUE_FILE, task=check_linkedin, local=False):
+    """Process every pending URL of one shard. Safe to run on another host."""
+    global _queue
+    _queue = (db_path, local)
+    conn = connect(db_path, local)
+    rows = conn.execute(
+        "SELECT key, url FROM tasks WHERE shard = ? AND status = 'pending' "
+        "ORDER BY key",
+        (shard,),
+    ).fetchall()
+
+    done = 0
+    try:
+        for key, url in rows:
+            try:
+                result = task(url)
+            except Exception as e:
+                # Remaining URLs stay pending, so the shard can be resumed later.
+                print(f"[!] Shard {shard} stopped at {url}: {e}")
+                break
+            with conn:
+                conn.execute(
+                    "UPDATE tasks SET status = ?, result = ? WHERE key = ?",
+                    (
+                        "done" if is_known(result) else "unknown",
+                        json.dumps(result, ensure_ascii=False),
+                        key,
+                    ),
+                )
+            done += 1
+    finally:
+        conn.close()
+        close_driver()
+
+    print(f"Shard {shard}: processed {done} URLs.")
+    return done
+
+
+def run_all_shards(num_shards, db_path=QUEUE_FILE, task=check_linkedin, processes=True):
+    """Run every shard on this host, so the queue can use WAL."""
+    if not processes:
+        return [
+            run_shard(shard, db_path, task, local=True) for shard in range(num_shards)
+        ]
+
+    with ProcessPoolExecutor(max_workers=num_shards) as pool:
+        futures = [
+            pool.submit(run_shard, shard, db_path, task, True)
+            for shard in range(num_shards)
+        ]
+        return [f.result() for f in futures]
+
+
+def merge_results(db_path=QUEUE_FILE, local=False):
+    """Return finished results keyed by normalized URL, in key order."""
+    conn = connect(db_path, local)
+    rows = conn.execute(
+        "SELECT key, result FROM tasks WHERE status = 'done' ORDER BY key"
+    ).fetchall()
+    conn.close()
+    return {key: json.loads(result) for key, result in rows}
+
+
+def enrich_all_sharded(
+    num_shards, input_path=DATA_FILE, db_path=QUEUE_FILE, processes=True, fresh=False
+):
+    """Sharded version of `linkedin_parser.enrich_all_from_json`."""
+    if not os.path.exists(input_path):
+        print(f"File not found: {input_path}")
+        return
+
+    with open(input_path, "r", encoding="utf-8") as f:
+        companies = json.load(f)
+
+    urls = pending_linkedin_urls(companies)
+    sizes = enqueue(urls, num_shards, db_path, True, fresh)
+    print(f"Shard sizes: {sizes}")
+
+    run_all_shards(num_shards, db_path, processes=processes)
+    updated = apply_results(companies, merge_results(db_path, True))
+
+    with open(input_path, "w", encoding="utf-8") as f:
+        json.dump(companies, f, indent=2, ensure_ascii=False)
+
+    print(f"Done. Updated {updated} companies.")
+
+
+def pending_linkedin_urls(companies):
+    return [
+        c["linkedin_url"]
+        for c in companies
+        if c.get("linkedin_url") and c.get("linkedin_mentions_s25") is None
+    ]
+
+
+def apply_results(companies, results):
+    updated = 0
+    for company in companies:
+        if company.get("linkedin_mentions_s25") is not None:
+            continue
+        url = company.get("linkedin_url")
+        result = results.get(normalize_url(url)) if url else None
+        if not is_known(result):
+            continue
+        company["linkedin_mentions_s25"], company["linkedin_match"] = result
+        updated += 1
+    return updated
+
+
+def scrape_yc_sharded(
+    num_shards,
+    output_path=DATA_FILE,
+    db_path=YC_QUEUE_FILE,
+    processes=True,
+    fresh=False,
+):
+    """Sharded version of `yc_parser.scrape_and_save`.
+
+    Listing the company links needs a single browser session; the company
+    pages are then parsed in parallel, one Chrome per shard. Companies that
+    left the listing are dropped from the queue, so the output only holds
+    the current links; pass `fresh` to re-parse pages scraped before.
+    """
+    from yc_parser import get_rendered_company_links
+
+    links = get_rendered_company_links()
+    print(f"Found {len(links)} companies.")
+    sizes = enqueue(links, num_shards, db_path, True, fresh, prune=True)
+    print(f"Shard sizes: {sizes}")
+
+    run_all_shards(num_shards, db_path, task=parse_yc_page, processes=processes)
+    save_yc_results(merge_results(db_path, True), output_path)
+
+
+def save_yc_results(results, output_path=DATA_FILE):
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(list(results.values()), f, indent=2, ensure_ascii=False)
+
+    print(f"Saved {len(results)} companies to {output_path}")
+
+
+TASKS = {"linkedin": check_linkedin, "yc": parse_yc_page}
+QUEUE_FILES = {"linkedin": QUEUE_FILE, "yc": YC_QUEUE_FILE}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sharded YC scraping and enrichment")
+    parser.add_argument("--job", choices=TASKS, default="linkedin")
+    parser.add_argument("--db", help="queue file, defaults to one per job")
+    parser.add_argument(
+        "--local",
+        action="store_true",
+        help="all workers run on this host; enables WAL on the queue file",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="enqueue, process all shards locally, merge")
+    run.add_argument("--shards", type=int, default=os.cpu_count() or 1)
+    run.add_argument("--input", default=DATA_FILE)
+    run.add_argument("--fresh", action="store_true", help="drop stored results")
+
+    enq = sub.add_parser("enqueue", help="split the URLs into shards")
+    enq.add_argument("--shards", type=int, required=True)
+    enq.add_argument("--input", default=DATA_FILE)
+    enq.add_argument("--fresh", action="store_true", help="drop stored results")
+
+    work = sub.add_parser("work", help="process a single shard")
+    work.add_argument("--shard", type=int, required=True)
+
+    merge = sub.add_parser("merge", help="write finished results into the input")
+    merge.add_argument("--input", default=DATA_FILE)
+
+    args = parser.parse_args()
+    db_path = args.db or QUEUE_FILES[args.job]
+
+    if args.command == "run":
+        if args.job == "yc":
+            scrape_yc_sharded(args.shards, args.input, db_path, fresh=args.fresh)
+        else:
+            enrich_all_sharded(args.shards, args.input, db_path, fresh=args.fresh)
+    elif args.command == "enqueue":
+        if args.job == "yc":
+            from yc_parser import get_rendered_company_links
+
+            urls = get_rendered_company_links()
+        else:
+            with open(args.input, "r", encoding="utf-8") as f:
+                urls = pending_linkedin_urls(json.load(f))
+        sizes = enqueue(
+            urls, args.shards, db_path, args.local, args.fresh, args.job == "yc"
+        )
+        print(f"Shard sizes: {sizes}")
+    elif args.command == "work":
+        run_shard(args.shard, db_path, TASKS[args.job], args.local)
+    elif args.command == "merge":
+        results = merge_results(db_path, args.local)
+        if args.job == "yc":
+            save_yc_results(results, args.input)
+            return
+        with open(args.input, "r", encoding="utf-8") as f:
+            companies = json.load(f)
+        updated = apply_results(companies, results)
+        with open(args.input, "w", encoding="utf-8") as f:
+            json.dump(companies, f, indent=2, ensure_ascii=False)
+        print(f"Done. Updated {updated} companies.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+PARSER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestCli(unittest.TestCase):
+
+    def test_discover_command_without_urls(self):
+        # Run as the README does: the script from the repository root.
+        repo_root = os.path.dirname(os.path.dirname(PARSER_DIR))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_path = os.path.join(tmpdir, "in.json")
+            output_path = os.path.join(tmpdir, "out.json")
+            with open(input_path, "w", encoding="utf-8") as f:
+                json.dump([{"name": "A", "linkedin_url": None}], f)
+
+            subprocess.run(
+                [
+                    sys.executable,
+                    os.path.join("app", "parser", "cli.py"),
+                    "discover",
+                    "--input",
+                    input_path,
+                    "--output",
+                    output_path,
+                ],
+                cwd=repo_root,
+                capture_output=True,
+                check=True,
+            )
+
+            with open(output_path, "r", encoding="utf-8") as f:
+                self.assertEqual(json.load(f), [{"name": "A", "linkedin_url": None}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+PARSER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ["requests", "bs4", "selenium", "tqdm", "pandas"]
+IMPORT_BUDGET = 1.0  # seconds, including interpreter startup
+
+
+def run_python(code, *args):
+    start = time.perf_counter()
+    out = subprocess.run(
+        [sys.executable, "-c", code, *args],
+        cwd=PARSER_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return out, time.perf_counter() - start
+
+
+class TestImports(unittest.TestCase):
+
+    def test_parser_modules_import_fast_without_heavy_deps(self):
+        code = (
+            "import sys, json\n"
+            "import cli, linkedin_enricher, linkedin_parser, politeness\n"
+            "import sharding, yc_parser\n"
+            f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+        )
+
+        out, elapsed = run_python(code)
+
+        self.assertEqual(json.loads(out), [])
+        self.assertLess(elapsed, IMPORT_BUDGET)
+
+    def test_dedup_command_is_fast(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_path = os.path.join(tmpdir, "in.json")
+            output_path = os.path.join(tmpdir, "out.json")
+            with open(input_path, "w", encoding="utf-8") as f:
+                json.dump([{"name": "A (YC S25)"}, {"name": "a"}], f)
+
+            code = (
+                "import sys, cli\n"
+                "cli.main(sys.argv[1:])\n"
+                f"print([m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+            )
+            out, elapsed = run_python(
+                code, "dedup", "--input", input_path, "--output", output_path
+            )
+
+            with open(output_path, "r", encoding="utf-8") as f:
+                self.assertEqual(len(json.load(f)), 1)
+        self.assertTrue(out.strip().endswith("[]"))
+        self.assertLess(elapsed, IMPORT_BUDGET)
+
+
+if __name__ == "__main__":
+    unittest.main()
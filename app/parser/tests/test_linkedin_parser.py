@@ -17,7 +17,7 @@ class TestLinkedInParser(unittest.TestCase):
         </html>
         """
 
-    @patch("app.parser.linkedin_parser.requests.get")
+    @patch("requests.get")
     def test_linkedin_check_yc_mention_positive(self, mock_get):
         mock_resp = Mock()
         mock_resp.status_code = 200
@@ -33,7 +33,7 @@ class TestLinkedInParser(unittest.TestCase):
         self.assertIn("snippet", match_info)
         self.assertEqual(match_info["location"], "name")
 
-    @patch("app.parser.linkedin_parser.requests.get")
+    @patch("requests.get")
     def test_linkedin_check_yc_mention_no_match(self, mock_get):
         mock_resp = Mock()
         mock_resp.status_code = 200
@@ -0,0 +1,68 @@
+import unittest
+from unittest.mock import Mock, patch
+import app.parser.linkedin_parser as linkedin_parser
+import app.parser.politeness as politeness
+
+
+def make_response(status_code=200, url="https://www.linkedin.com/company/x"):
+    resp = Mock()
+    resp.status_code = status_code
+    resp.url = url
+    resp.history = []
+    resp.headers = {}
+    resp.text = "<html><body><h1>Random Company</h1></body></html>"
+    return resp
+
+
+class TestPolitenessController(unittest.TestCase):
+
+    def setUp(self):
+        self.sleeps = []
+        self.controller = politeness.PolitenessController(
+            sleep=self.sleeps.append, block_window=4, max_pauses=1
+        )
+
+    def test_classify_response(self):
+        self.assertEqual(politeness.classify_response(make_response()), "ok")
+        self.assertEqual(politeness.classify_response(make_response(999)), "blocked")
+        self.assertEqual(politeness.classify_response(make_response(429)), "throttled")
+        authwall = make_response(url="https://www.linkedin.com/authwall?trk=x")
+        self.assertEqual(politeness.classify_response(authwall), "blocked")
+
+    def test_aimd(self):
+        for _ in range(8):
+            self.controller.record("ok")
+        self.assertEqual(self.controller.batch_size, 3)
+        first_headers = self.controller.headers
+
+        self.controller.record("blocked")
+
+        self.assertEqual(self.controller.batch_size, 1)
+        self.assertEqual(self.controller.delay, 2.0)
+        self.assertIsNot(self.controller.headers, first_headers)
+
+    def test_pause_then_stop(self):
+        for _ in range(4):
+            self.controller.record("blocked")
+        self.controller.wait()
+        self.assertEqual(self.sleeps, [300])
+
+        for _ in range(4):
+            self.controller.record("blocked")
+        with self.assertRaises(politeness.BlockedError):
+            self.controller.wait()
+
+    @patch("requests.get")
+    def test_linkedin_check_reports_block(self, mock_get):
+        mock_get.return_value = make_response(999)
+
+        matched, _ = linkedin_parser.linkedin_check_yc_mention(
+            "https://www.linkedin.com/company/x", self.controller
+        )
+
+        self.assertIsNone(matched)
+        self.assertEqual(self.controller.block_rate, 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,213 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+import app.parser.sharding as sharding
+
+# Shard tasks import sibling modules by their flat names, like the scripts do.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def fake_check(url):
+    return True, {"location": "name", "snippet": url}
+
+
+class TestSharding(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmpdir.name, "shards.db")
+        self.urls = [f"https://www.linkedin.com/company/c{i}" for i in range(50)]
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_split_into_shards_is_stable_and_complete(self):
+        shards = sharding.split_into_shards(self.urls, 4)
+
+        self.assertEqual(shards, sharding.split_into_shards(self.urls, 4))
+        self.assertEqual(sorted(sum(shards, [])), sorted(self.urls))
+
+    def test_adding_shard_moves_only_some_urls(self):
+        ring_4 = sharding.build_ring(4)
+        ring_5 = sharding.build_ring(5)
+
+        moved = [
+            url
+            for url in self.urls
+            if sharding.shard_for_url(url, ring_4)
+            != sharding.shard_for_url(url, ring_5)
+        ]
+
+        self.assertLess(len(moved), len(self.urls) / 2)
+        for url in moved:
+            self.assertEqual(sharding.shard_for_url(url, ring_5), 4)
+
+    def test_run_and_merge(self):
+        sharding.enqueue(self.urls, 3, self.db_path)
+        sharding.run_all_shards(3, self.db_path, task=fake_check, processes=False)
+
+        results = sharding.merge_results(self.db_path)
+
+        self.assertEqual(list(results), sorted(self.urls))
+        self.assertTrue(results[self.urls[0]][0])
+
+    def test_enqueue_resumes_and_retries_unknown(self):
+        urls = self.urls[:2]
+        sharding.enqueue(urls, 2, self.db_path)
+        sharding.run_all_shards(
+            2,
+            self.db_path,
+            task=lambda url: (None, None) if url == urls[0] else fake_check(url),
+            processes=False,
+        )
+
+        sharding.enqueue(urls, 2, self.db_path)
+        seen = []
+        sharding.run_all_shards(
+            2, self.db_path, task=lambda url: seen.append(url), processes=False
+        )
+
+        self.assertEqual(seen, [urls[0]])
+
+    def test_run_in_worker_processes(self):
+        sharding.enqueue(self.urls, 3, self.db_path)
+
+        done = sharding.run_all_shards(3, self.db_path, task=fake_check)
+
+        self.assertEqual(sum(done), len(self.urls))
+        self.assertEqual(
+            list(sharding.merge_results(self.db_path, True)), sorted(self.urls)
+        )
+
+    def test_prune_keeps_only_current_urls(self):
+        sharding.enqueue(self.urls[:40], 3, self.db_path)
+        sharding.run_all_shards(3, self.db_path, task=fake_check, processes=False)
+
+        sharding.enqueue(self.urls[:5], 3, self.db_path, prune=True)
+        seen = []
+        sharding.run_all_shards(
+            3, self.db_path, task=lambda url: seen.append(url), processes=False
+        )
+
+        self.assertEqual(seen, [])
+        self.assertEqual(
+            list(sharding.merge_results(self.db_path)), sorted(self.urls[:5])
+        )
+
+    def test_fresh_refetches_everything(self):
+        sharding.enqueue(self.urls[:5], 2, self.db_path)
+        sharding.run_all_shards(2, self.db_path, task=fake_check, processes=False)
+
+        sharding.enqueue(self.urls[:5], 2, self.db_path, fresh=True)
+        seen = []
+        sharding.run_all_shards(
+            2, self.db_path, task=lambda url: seen.append(url), processes=False
+        )
+
+        self.assertEqual(sorted(seen), sorted(self.urls[:5]))
+
+    def test_yc_driver_is_quit_when_shard_ends(self):
+        driver = Mock()
+        sharding.enqueue(self.urls[:3], 1, self.db_path)
+
+        with patch("yc_parser.make_driver", return_value=driver) as make_driver:
+            with patch("yc_parser.parse_company_page", return_value={"name": "A"}):
+                sharding.run_all_shards(
+                    1, self.db_path, task=sharding.parse_yc_page, processes=False
+                )
+
+        make_driver.assert_called_once()
+        driver.quit.assert_called_once()
+
+    def test_trailing_slash_variants_are_queued_once(self):
+        urls = [self.urls[0], self.urls[0] + "/"]
+        seen = []
+        sharding.enqueue(urls, 2, self.db_path)
+        sharding.run_all_shards(
+            2, self.db_path, task=lambda url: seen.append(url) or True, processes=False
+        )
+
+        companies = [
+            {"linkedin_url": self.urls[0] + "/", "linkedin_mentions_s25": None}
+        ]
+        results = {sharding.normalize_url(self.urls[0]): [True, None]}
+        sharding.apply_results(companies, results)
+
+        self.assertEqual(len(seen), 1)
+        self.assertTrue(companies[0]["linkedin_mentions_s25"])
+
+    def test_journal_mode(self):
+        conn = sharding.connect(self.db_path)
+        self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "delete")
+        conn.close()
+
+        conn = sharding.connect(self.db_path, local=True)
+        self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        conn.close()
+
+    def test_yc_pages_are_merged_in_url_order(self):
+        sharding.enqueue(reversed(self.urls), 3, self.db_path)
+        sharding.run_all_shards(
+            3, self.db_path, task=lambda url: {"name": url}, processes=False
+        )
+        output_path = os.path.join(self.tmpdir.name, "yc.json")
+
+        sharding.save_yc_results(sharding.merge_results(self.db_path), output_path)
+
+        with open(output_path, "r", encoding="utf-8") as f:
+            names = [c["name"] for c in json.load(f)]
+        self.assertEqual(names, sorted(self.urls))
+
+    def pacing(self, **settings):
+        # run_all_shards opens the queue in local (WAL) mode.
+        return sharding.SharedPacing(
+            self.db_path, local=True, sleep=lambda s: None, **settings
+        )
+
+    def test_block_in_one_shard_slows_the_others(self):
+        sharding.enqueue(self.urls, 2, self.db_path)
+        first, second = self.pacing(), self.pacing()
+
+        first.wait()
+        first.record("throttled")
+        second.wait()
+
+        self.assertEqual(second.controller.delay, 2.0)
+        self.assertIsNot(second.headers, first.controller.profiles[0])
+
+    def test_blocked_shard_stops_the_others(self):
+        sharding.enqueue(self.urls, 3, self.db_path)
+
+        def blocked_task(url):
+            pacing = self.pacing(block_window=2, max_pauses=0)
+            pacing.wait()
+            pacing.record("blocked")
+            return fake_check(url)
+
+        done = sharding.run_all_shards(
+            3, self.db_path, task=blocked_task, processes=False
+        )
+
+        self.assertEqual(sum(done), 1)
+        self.assertEqual(len(sharding.merge_results(self.db_path, True)), 1)
+
+    def test_apply_results_skips_unknown(self):
+        companies = [
+            {"linkedin_url": "a", "linkedin_mentions_s25": None},
+            {"linkedin_url": "b", "linkedin_mentions_s25": None},
+        ]
+        results = {"a": [True, {"location": "name", "snippet": "yc s25"}]}
+        results["b"] = [None, None]
+
+        updated = sharding.apply_results(companies, results)
+
+        self.assertEqual(updated, 1)
+        self.assertTrue(companies[0]["linkedin_mentions_s25"])
+        self.assertIsNone(companies[1]["linkedin_mentions_s25"])
+
+
+if __name__ == "__main__":
+    unittest.main()
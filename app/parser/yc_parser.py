@@ -1,9 +1,3 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from tqdm import tqdm
 import os
 import json
 import time
@@ -14,11 +8,23 @@ from config import YC_SELECTORS
 BASE_URL = "https://www.ycombinator.com/companies?batch=Summer%202025"
 
 
-def get_rendered_company_links(batch="Summer%202025"):
+def make_driver():
+    """Start headless Chrome. Selenium is imported here, not at module import."""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
     options = Options()
     options.add_argument("--headless")
     options.add_argument("--disable-gpu")
-    driver = webdriver.Chrome(options=options)
+    return webdriver.Chrome(options=options)
+
+
+def get_rendered_company_links(batch="Summer%202025"):
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+
+    driver = make_driver()
 
     driver.get(f"https://www.ycombinator.com/companies?batch={batch}")
     wait = WebDriverWait(driver, 10)
@@ -40,12 +46,13 @@ def get_rendered_company_links(batch="Summer%202025"):
 
 
 def parse_company_page(url, driver=None):
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+
     should_close = False
     if driver is None:
-        options = Options()
-        options.add_argument("--headless")
-        options.add_argument("--disable-gpu")
-        driver = webdriver.Chrome(options=options)
+        driver = make_driver()
         should_close = True
 
     try:
@@ -99,12 +106,11 @@ def parse_company_page(url, driver=None):
 
 
 def scrape_and_save(output_path="data/yc_s25_companies.json"):
+    from tqdm import tqdm
+
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
-    options = Options()
-    options.add_argument("--headless")
-    options.add_argument("--disable-gpu")
-    driver = webdriver.Chrome(options=options)
+    driver = make_driver()
 
     try:
         links = get_rendered_company_links()
@@ -2,7 +2,6 @@
 
 import json
 import streamlit as st
-import pandas as pd
 
 st.set_page_config(page_title="YC S25 Directory", layout="wide")
 st.title("🚀 Y Combinator S25 Companies")
@@ -16,6 +15,8 @@ except FileNotFoundError:
     st.error("No data file found. Run the scraper first.")
     st.stop()
 
+import pandas as pd  # only needed once there is data to show
+
 df = pd.DataFrame(data)
 
 if "source" not in df.columns: